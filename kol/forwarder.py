@@ -18,7 +18,7 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(),  # 콘솔 출력
-        logging.FileHandler('forwarder.log', encoding='utf-8')  # 파일 저장
+        logging.FileHandler('forwarder.log', encoding='utf-8', delay=True)  # 파일 저장 (첫 로그 기록 시 열기)
     ]
 )
 logger = logging.getLogger(__name__)
@@ -28,17 +28,29 @@ API_ID = os.getenv('TELEGRAM_API_ID')
 API_HASH = os.getenv('TELEGRAM_API_HASH')
 BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', '7948096537:AAFeuf-Km1xV_Z7eG8el7GMLrTthlF-M34o')
 
+# 한글 패턴 (모듈 로드 시 한 번만 컴파일)
+KOREAN_PATTERN = re.compile(r'[가-힣]')
+
+# 제외할 단어들 - 고정 목록이므로 패턴도 모듈 로드 시 한 번만 생성
+EXCLUDE_WORDS = (
+    '에어드랍', '파트너', '당첨', '후기', '체커', '공개', 'AMA', 'ama', '원문', '예정',
+    'TGE', '소식', '클레임', '링크', '트위터', '이벤트', '지급', '출시', '켐페인',
+    '추천', '채굴', '인터뷰', '파밍', '밋업', '콘테스트', '#kol'
+)
+EXCLUDE_PATTERN = re.compile('|'.join(
+    map(re.escape, sorted({word.lower() for word in EXCLUDE_WORDS}, key=len, reverse=True))
+))
+
 class MessageFilter:
     def __init__(self):
-        # 제외할 단어들 (총 25개)
-        self.exclude_words = [
-            '에어드랍', '파트너', '당첨', '후기', '체커', '공개', 'AMA', 'ama', '원문', '예정',
-            'TGE', '소식', '클레임', '링크', '트위터', '이벤트', '지급', '출시', '켐페인',
-            '추천', '채굴', '인터뷰', '파밍', '밋업', '콘테스트', '#kol'
-        ]
+        # 제외할 단어들 (총 26개)
+        self.exclude_words = EXCLUDE_WORDS
         
         # 한글 패턴
-        self.korean_pattern = re.compile(r'[가-힣]')
+        self.korean_pattern = KOREAN_PATTERN
+        
+        # 제외 단어 패턴 (모든 단어를 한 번의 스캔으로 검사)
+        self.exclude_pattern = EXCLUDE_PATTERN
     
     def has_korean(self, text: str) -> bool:
         """텍스트에 한글이 포함되어 있는지 확인"""
@@ -55,9 +67,8 @@ class MessageFilter:
         
         # 2. 특정 단어가 포함되면 제외
         text_lower = message_text.lower()  # 대소문자 구분 없이 체크
-        for word in self.exclude_words:
-            if word.lower() in text_lower:
-                return False
+        if self.exclude_pattern.search(text_lower):
+            return False
         
         return True
 
@@ -35,6 +35,16 @@ API_ID = os.getenv('TELEGRAM_API_ID')
 API_HASH = os.getenv('TELEGRAM_API_HASH')
 BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', '7948096537:AAFeuf-Km1xV_Z7eG8el7GMLrTthlF-M34o')
 
+# 한글 패턴 (모듈 로드 시 한 번만 컴파일)
+KOREAN_PATTERN = re.compile(r'[가-힣]')
+
+# 기본 제외 단어 (모듈 로드 시 한 번만 생성)
+DEFAULT_EXCLUDE_WORDS = (
+    '에어드랍', '파트너', '당첨', '후기', '체커', '공개', 'AMA', 'ama', '원문', '예정',
+    'TGE', '소식', '클레임', '링크', '트위터', '이벤트', '지급', '출시', '켠페인',
+    '추천', '채굴', '인터뷰', '파밍', '밋업', '콘테스트', '#kol', '란?', 'KYC'
+)
+
 # 전역 변수로 봇 인스턴스 관리
 forwarder_instance = None
 
@@ -57,15 +67,20 @@ class StatusResponse(BaseModel):
 
 class MessageFilter:
     def __init__(self):
-        # 제외할 단어들 (기본값)
-        self.exclude_words = [
-            '에어드랍', '파트너', '당첨', '후기', '체커', '공개', 'AMA', 'ama', '원문', '예정',
-            'TGE', '소식', '클레임', '링크', '트위터', '이벤트', '지급', '출시', '켠페인',
-            '추천', '채굴', '인터뷰', '파밍', '밋업', '콘테스트', '#kol', '란?', 'KYC'
-        ]
+        # 제외할 단어들 (기본값 복사 - API로 수정 가능)
+        self.exclude_words = list(DEFAULT_EXCLUDE_WORDS)
         
         # 한글 패턴
-        self.korean_pattern = re.compile(r'[가-힣]')
+        self.korean_pattern = KOREAN_PATTERN
+        
+        # 제외 단어 패턴 (단어 목록 변경 시 재생성)
+        self._compile_exclude_pattern()
+    
+    def _compile_exclude_pattern(self):
+        """제외 단어들을 하나의 정규식으로 컴파일"""
+        # 빈 문자열도 그대로 포함 - 기존처럼 모든 메시지와 일치
+        words = sorted({word.lower() for word in self.exclude_words}, key=len, reverse=True)
+        self.exclude_pattern = re.compile('|'.join(map(re.escape, words))) if words else None
     
     def has_korean(self, text: str) -> bool:
         """텍스트에 한글이 포함되어 있는지 확인"""
@@ -80,29 +95,30 @@ class MessageFilter:
         if not self.has_korean(message_text):
             return False
         
-        # 2. 특정 단어가 포함되면 제외
-        text_lower = message_text.lower()
-        for word in self.exclude_words:
-            if word.lower() in text_lower:
-                return False
+        # 2. 특정 단어가 포함되면 제외 (한 번의 스캔으로 모든 단어 검사)
+        if self.exclude_pattern and self.exclude_pattern.search(message_text.lower()):
+            return False
         
         return True
     
     def update_exclude_words(self, words: List[str]):
         """제외 단어 목록 업데이트"""
         self.exclude_words = words
+        self._compile_exclude_pattern()
     
     def add_exclude_words(self, words: List[str]):
         """제외 단어 추가"""
         for word in words:
             if word not in self.exclude_words:
                 self.exclude_words.append(word)
+        self._compile_exclude_pattern()
     
     def remove_exclude_words(self, words: List[str]):
         """제외 단어 제거"""
         for word in words:
             if word in self.exclude_words:
                 self.exclude_words.remove(word)
+        self._compile_exclude_pattern()
 
 class TelegramForwarderBot:
     def __init__(self):
@@ -119,6 +135,8 @@ class TelegramForwarderBot:
             'errors': 0
         }
         self.event_handlers = []
+        # chat_id -> 채널 표시 이름 (메시지마다 get_chat 호출 방지)
+        self.channel_names = {}
     
     async def connect(self):
         """클라이언트 연결"""
@@ -183,22 +201,25 @@ class TelegramForwarderBot:
         
         # 이벤트 핸들러 함수 정의
         async def handle_new_message(event):
-            logger.info(f"🔔 이벤트 핸들러 호출됨 - 실행 상태: {self.is_running}")
+            logger.debug(f"🔔 이벤트 핸들러 호출됨 - 실행 상태: {self.is_running}")
             
             if not self.is_running:
                 logger.info("❌ 봇이 실행 중이 아님 - 이벤트 무시")
                 return
                 
-            try:
-                channel_entity = await event.get_chat()
-                channel_name = f"@{channel_entity.username}" if channel_entity.username else channel_entity.title
-                logger.info(f"📡 채널 정보 - 이름: {channel_name}, ID: {channel_entity.id}")
-            except Exception as e:
-                channel_name = "Unknown"
-                logger.error(f"❌ 채널 정보 가져오기 실패: {e}")
+            channel_name = self.channel_names.get(event.chat_id)
+            if channel_name is None:
+                try:
+                    channel_entity = await event.get_chat()
+                    channel_name = f"@{channel_entity.username}" if channel_entity.username else channel_entity.title
+                    self.channel_names[event.chat_id] = channel_name
+                    logger.info(f"📡 채널 정보 - 이름: {channel_name}, ID: {channel_entity.id}")
+                except Exception as e:
+                    channel_name = "Unknown"
+                    logger.error(f"❌ 채널 정보 가져오기 실패: {e}")
             
             logger.info(f"🔔 새 메시지 감지: {channel_name} 메시지 ID {event.message.id}")
-            logger.info(f"📝 메시지 내용 미리보기: {event.message.text[:50] if event.message.text else '텍스트 없음'}...")
+            logger.debug(f"📝 메시지 내용 미리보기: {event.message.text[:50] if event.message.text else '텍스트 없음'}...")
             
             await self.forward_message(event.message, channel_name)
         
@@ -475,23 +496,26 @@ async def test_channels():
     if not forwarder_instance:
         raise HTTPException(status_code=503, detail="봇이 초기화되지 않았습니다")
     
-    results = {}
-    
-    for channel in forwarder_instance.source_channels + [forwarder_instance.target_channel]:
+    async def check_channel(channel):
         try:
             entity = await forwarder_instance.user_client.get_entity(channel)
-            results[channel] = {
+            return {
                 "status": "success",
                 "title": entity.title,
                 "id": entity.id,
                 "username": getattr(entity, 'username', None)
             }
         except Exception as e:
-            results[channel] = {
+            return {
                 "status": "error",
                 "error": str(e)
             }
     
+    # 채널별 조회는 서로 독립적이므로 동시에 실행
+    channels = forwarder_instance.source_channels + [forwarder_instance.target_channel]
+    checks = await asyncio.gather(*(check_channel(channel) for channel in channels))
+    results = dict(zip(channels, checks))
+    
     return {"channels": results}
 
 # 에러 핸들러